@@ -1,6 +1,7 @@
 from alpenstock.lmdb_cache import LMDBCache
 from pydantic import BaseModel
 import multiprocessing as mp
+import pickle
 import time
 from random import random
 import tempfile
@@ -10,25 +11,61 @@ class TaskDescriptor(BaseModel):
     result: str | None = None  # result of the computation task
 
 
-def worker(task_list: list[TaskDescriptor], cache_params) -> list[TaskDescriptor]:
+# Process-local cache, opened once per worker by the Pool initializer.
+# Opening an LMDB environment involves mmap and reader-table setup, so it is
+# done once per worker process rather than once per batch.
+_CACHE: LMDBCache | None = None
+
+
+def _init_cache(cache_params):
+    global _CACHE
+    _CACHE = LMDBCache(**cache_params)
+
+
+def worker(task_list: list[TaskDescriptor]) -> list[TaskDescriptor]:
     print(f"Worker started with {len(task_list)} tasks.")
-    with LMDBCache(**cache_params) as cache:
+    cache = _CACHE
+
+    # Phase 1: look up the whole batch in a single read transaction. Each
+    # transaction begin claims a reader slot and reads the meta page, so one
+    # begin/commit pair per batch beats one per task. `buffers=True` hands
+    # back zero-copy memoryviews; they are deserialized before the
+    # transaction ends. LMDBCache pickles its keys, so do the same here.
+    with cache.env.begin(buffers=True) as rtxn:
+        cur = rtxn.cursor()
+        hits = {}
         for task in task_list:
-            cached_result = cache.get(task.key)
-            if cached_result is not None:
-                # If the result is already cached, skip computation
-                print(f"Cache hit for {task.key}, skipping computation.")
-                task.result = cached_result.result
-            else:
-                # Simulate some computation
-                result = f"Compute result for {task.key}"
-                task.result = result
-
-                time.sleep(0.1 + random() * 0.4) # Simulate variable computation time
-
-                # Store the result in the cache
-                print(f"Caching result for {task.key}")
-                cache.put(task.key, task)
+            raw = cur.get(pickle.dumps(task.key))
+            hits[task.key] = pickle.loads(raw) if raw is not None else None
+
+    new_items: list[tuple[str, TaskDescriptor]] = []
+    for task in task_list:
+        cached_result = hits[task.key]
+        if cached_result is not None:
+            # If the result is already cached, skip computation
+            print(f"Cache hit for {task.key}, skipping computation.")
+            task.result = cached_result.result
+        else:
+            # Simulate some computation
+            result = f"Compute result for {task.key}"
+            task.result = result
+
+            time.sleep(0.1 + random() * 0.4) # Simulate variable computation time
+
+            print(f"Caching result for {task.key}")
+            new_items.append((task.key, task))
+
+    # Phase 2: store all new results in a single write transaction.
+    # `putmulti` with keys in sorted order lets LMDB take its append-style
+    # fast path inside the B-tree insert.
+    if new_items:
+        new_items.sort(key=lambda kv: kv[0])
+        with cache.env.begin(write=True) as wtxn:
+            cur = wtxn.cursor()
+            cur.putmulti(
+                [(pickle.dumps(k), pickle.dumps(v)) for k, v in new_items]
+            )
+
     return task_list
 
 
@@ -42,10 +79,10 @@ def main():
     batch_size = 3
     batches = [tasks[i:i + batch_size] for i in range(0, len(tasks), batch_size)]
 
-    # Start processing    
+    # Start processing
     cache_params = {"path": tempfile.mkdtemp(), "map_size": (1024**2) * 512}  # 512 MB cache
-    with mp.Pool(processes=4) as pool:
-        results = pool.starmap(worker, [(batch, cache_params) for batch in batches])
+    with mp.Pool(processes=4, initializer=_init_cache, initargs=(cache_params,)) as pool:
+        results = pool.map(worker, batches)
     
     # Flatten the results
     results = [task for batch in results for task in batch]
@@ -1,43 +1,64 @@
-import lmdb
 from alpenstock.lmdb_cache import LMDBCache
 import multiprocessing as mp
 import tempfile
 
-global_cache = None
+### Former failure case 1:
+###   Closing the LMDB environment in a child process
+###
+### The original version of this script shared a fork()-inherited LMDBCache
+### with the child and deliberately closed it there, which invalidated the
+### parent's reader slot and raised `lmdb.BadRslotError` in the parent.
+### With a `forkserver` context and a per-child initializer, each worker owns
+### its own environment, so closing it is a purely local operation.
 
-### Failure case 1: Deliberately closing the shared LMDB environment in a child process
+# Each worker process gets its own LMDBCache, stored in this module-level
+# slot by the Pool initializer. It is never shared across processes.
+worker_cache = None
+worker_cache_dir = None
+
+
+def worker_initializer(temp_dir):
+    # Runs once per worker process: open a process-local LMDB environment.
+    global worker_cache, worker_cache_dir
+    worker_cache_dir = temp_dir
+    worker_cache = LMDBCache(path=temp_dir)
 
-def deliberately_close_shared_lmdb_in_child():
-    # Initialize the global_cache in the main process, which
-    # is then shared with the forked child processes.
-    temp_dir = tempfile.mkdtemp()
-    global global_cache
-    global_cache = LMDBCache(path=temp_dir)
-    global_cache.put("key1", "value1")
 
-    print(f"Global cache: key1 = {global_cache.get('key1')}")
+def child_proc_close_own_cache(key):
+    global worker_cache
+    value = worker_cache.get(key)
 
-    # Make sure that fork is used for process creation
-    mp.set_start_method('fork', force=True)
+    # Closing the worker-local environment only releases this process's own
+    # reader slot, not the parent's. Re-open it afterwards so the worker can
+    # keep serving tasks.
+    worker_cache.env.close()
+    worker_cache = LMDBCache(path=worker_cache_dir)
+    return value
 
-    # Fork a new process
-    process = mp.Process(target=child_proc_close_cache_intentionally)
-    process.start()
-    process.join()
 
-    # Check if the global_cache is still accessible in the main process
-    try:
-        print(f"Main process after child: key1 = {global_cache.get('key1')}")
-    except lmdb.BadRslotError as e:
-        print("The global cache is no longer accessible in the main process after the child process closed it.")
-        print(f"A `lmdb.BadRslotError` is raised: {e}")
+def close_worker_local_lmdb_in_child():
+    # Initialize a cache in the main process. With `forkserver`, the workers
+    # do not inherit this handle; each opens its own via `worker_initializer`.
+    temp_dir = tempfile.mkdtemp()
+    main_cache = LMDBCache(path=temp_dir)
+    main_cache.put("key1", "value1")
+
+    print(f"Main cache: key1 = {main_cache.get('key1')}")
 
+    # Use a forkserver context so that the parent's LMDB environment is never
+    # duplicated into the child processes.
+    ctx = mp.get_context("forkserver")
+    with ctx.Pool(
+        processes=2,
+        initializer=worker_initializer,
+        initargs=(temp_dir,),
+    ) as pool:
+        results = pool.map(child_proc_close_own_cache, ["key1", "key1"])
+    print(f"Values read by workers: {results}")
 
-def child_proc_close_cache_intentionally():
-    # Close the global cache in the child process
-    global global_cache
-    global_cache.env.close()
+    # The main cache is unaffected by the workers closing their own caches.
+    print(f"Main process after workers: key1 = {main_cache.get('key1')}")
 
 
 if __name__ == "__main__":
-    deliberately_close_shared_lmdb_in_child()
+    close_worker_local_lmdb_in_child()
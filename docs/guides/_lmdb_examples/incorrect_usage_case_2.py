@@ -1,56 +1,66 @@
-import lmdb
 from alpenstock.lmdb_cache import LMDBCache
 import multiprocessing as mp
 import tempfile
 
-### Failure case 2:
-###   Unintentionally closing the shared LMDB environment in a child process
+### Former failure case 2:
+###   Letting the GC close the LMDB environment in a child process
+###
+### The original version of this script nullified a fork()-inherited
+### LMDBCache in the child, so the GC closed the shared environment and the
+### parent later hit `lmdb.BadRslotError`. With a `forkserver` context and a
+### per-child initializer, each worker owns its own environment, so the GC
+### collecting it cannot break any other process.
 
-global_cache = None
+worker_cache = None
+worker_cache_dir = None
 
 
-def unintentionally_close_shared_lmdb_in_child():
-    # Initialize the global_cache in the main process, which
-    # is then shared with the forked child processes.
-    temp_dir = tempfile.mkdtemp()
-    global global_cache
-    global_cache = LMDBCache(path=temp_dir)
-    global_cache.put("key1", "value1")
-
-    print(f"Global cache: key1 = {global_cache.get('key1')}")
-
-    # Make sure that fork is used for process creation
-    mp.set_start_method("fork", force=True)
-
-    # Fork a new process
-    process = mp.Process(target=child_proc_unintentionally_close_cache)
-    process.start()
-    process.join()
-
-    # Check if the global_cache is still accessible in the main process
-    try:
-        print(f"Main process after child: key1 = {global_cache.get('key1')}")
-    except lmdb.BadRslotError as e:
-        print(
-            "The global cache is no longer accessible in the main process after the child process closed it."
-        )
-        print(f"A `lmdb.BadRslotError` is raised: {e}")
-
-
-def child_proc_unintentionally_close_cache():
-    # Subjectively, the child process do not wish to break the global cache,
-    # deciding to nullify the global_cache variable so that it is no longer
-    # accessible.
-    global global_cache
-    global_cache = None
-
-    # However, this will cause the GC to close the LMDB environment and
-    # eventually raise a `lmdb.BadRslotError` in the main process. Here, we
-    # trigger a GC manually to emulate the behavior.
+def worker_initializer(temp_dir):
+    # Runs once per worker process: open a process-local LMDB environment.
+    global worker_cache, worker_cache_dir
+    worker_cache_dir = temp_dir
+    worker_cache = LMDBCache(path=temp_dir)
+
+
+def child_proc_drop_own_cache(key):
+    global worker_cache
+    value = worker_cache.get(key)
+
+    # Nullify the worker-local cache. The GC then closes the worker's own
+    # environment; the parent's environment is a separate handle and stays
+    # intact. Trigger a GC manually to emulate the original scenario, then
+    # re-open so the worker can keep serving tasks.
+    worker_cache = None
     import gc
 
     gc.collect()
+    worker_cache = LMDBCache(path=worker_cache_dir)
+    return value
+
+
+def drop_worker_local_lmdb_in_child():
+    # Initialize a cache in the main process. With `forkserver`, the workers
+    # do not inherit this handle; each opens its own via `worker_initializer`.
+    temp_dir = tempfile.mkdtemp()
+    main_cache = LMDBCache(path=temp_dir)
+    main_cache.put("key1", "value1")
+
+    print(f"Main cache: key1 = {main_cache.get('key1')}")
+
+    # Use a forkserver context so that the parent's LMDB environment is never
+    # duplicated into the child processes.
+    ctx = mp.get_context("forkserver")
+    with ctx.Pool(
+        processes=2,
+        initializer=worker_initializer,
+        initargs=(temp_dir,),
+    ) as pool:
+        results = pool.map(child_proc_drop_own_cache, ["key1", "key1"])
+    print(f"Values read by workers: {results}")
+
+    # The main cache is unaffected by the GC running in the workers.
+    print(f"Main process after workers: key1 = {main_cache.get('key1')}")
 
 
 if __name__ == "__main__":
-    unintentionally_close_shared_lmdb_in_child()
+    drop_worker_local_lmdb_in_child()
@@ -1,8 +1,9 @@
-from ._mixin import AutoSliceMixin, SliceHint, SliceFunc
+from ._mixin import AutoSliceMixin, SliceHint, SliceFunc, fancy_slice_for_str
 
 
 __all__ = [
     "AutoSliceMixin",
     "SliceHint",
     "SliceFunc",
-]
\ No newline at end of file
+    "fancy_slice_for_str",
+]
@@ -2,6 +2,8 @@ from typing import Type, Any, Literal, get_type_hints, Self, Protocol
 from collections.abc import Sequence
 import attrs
 import copy
+import warnings
+import weakref
 from ._types import COMMON_ND_ARRAYS, np, torch, jnp
 import pydantic
 
@@ -40,8 +42,22 @@ def can_handle(value: Any) -> bool:
 
 
 def fancy_slice_for_builtin_list(arr, key, hint: SliceHint | None = None):
+    # Builtin keys stay on list.__getitem__: it handles `slice` natively, and
+    # a `range` converts to an equivalent slice, avoiding a per-index loop.
+    # The conversion is only valid when every index of the range is a plain
+    # in-bounds index: a slice reinterprets negative values as end-relative
+    # (range(3, -1, -1) must reverse the list, not clamp) and silently clamps
+    # out-of-range indices where an index sequence raises IndexError. Other
+    # ranges fall through to the index-array path below.
     if isinstance(key, slice):
         return arr[key]
+    if (
+        isinstance(key, range)
+        and key.start >= 0
+        and key.stop >= 0
+        and (len(key) == 0 or max(key[0], key[-1]) < len(arr))
+    ):
+        return arr[slice(key.start, key.stop, key.step)]
 
     # NumPy / Torch / Jax array-like support .tolist()
     if hasattr(key, "tolist"):
@@ -117,37 +133,154 @@ def native_slice_func(value: Any, key: Any, hint: SliceHint | None = None):
 
 
 def copy_slice_func(value: Any, key: Any, hint: SliceHint | None = None):
+    if np is not None and isinstance(value, np.ndarray):
+        # `ndarray.copy` skips the Python-level `__copy__` dispatch of
+        # `copy.copy`; order="K" keeps the source memory layout.
+        return value.copy(order="K")
     return copy.copy(value)
 
 
-def _getitem_impl_for_attrs(self, key: Any):
-    cls = type(self)
+def fancy_slice_for_str(value: str, key: Any, hint: SliceHint | None = None):
+    """Slice a string as if it were a 1-D array of characters.
+
+    Meant for string fields annotated with `SliceHint(func=fancy_slice_for_str)`.
+    Works directly on the string instead of going through
+    `np.asarray(list(value))`, which would allocate a one-character str object
+    per character plus a throwaway object-dtype array.
+    """
+    if isinstance(key, slice):
+        return value[key]
+
+    if np is not None and value.isascii():
+        idx = np.asarray(key)
+        if idx.dtype.kind in "bi":
+            # ASCII round-trips 1:1 through bytes, so the whole selection is
+            # one memcpy in and one out, instead of a Python-level join over
+            # per-character str objects.
+            arr = np.frombuffer(value.encode("ascii"), dtype="S1")
+            return arr[idx].tobytes().decode("ascii")
+
+    # NumPy / Torch / Jax array-like support .tolist()
+    if hasattr(key, "tolist"):
+        key = key.tolist()
+
+    if isinstance(key, Sequence) and not isinstance(key, (str, bytes)):
+        if all(isinstance(i, bool) for i in key):
+            # boolean mask
+            return "".join(c for c, m in zip(value, key) if m)
+        else:
+            # assume index-array
+            return "".join(value[i] for i in key)
+
+    raise TypeError("Unsupported type for fancy slicing of str")
+
+
+# Below this many elements, the `flatnonzero` setup cost outweighs the gain
+# of integer fancy indexing over boolean indexing.
+_BOOL_MASK_TO_INDEX_MIN_SIZE = 64
+
+
+def _maybe_bool_mask_to_indices(key: Any) -> Any:
+    """Convert a large boolean mask key into an integer index array.
+
+    Integer fancy indexing is faster than boolean indexing on moderately
+    large arrays, and the conversion only needs to happen once per slice
+    call instead of once per field. Small masks are left as-is.
+    """
+    if np is None:
+        return key
+
+    if isinstance(key, np.ndarray):
+        if key.dtype == np.bool_ and key.size >= _BOOL_MASK_TO_INDEX_MIN_SIZE:
+            return np.flatnonzero(key)
+        return key
+
+    if isinstance(key, list) and len(key) >= _BOOL_MASK_TO_INDEX_MIN_SIZE:
+        arr = np.asarray(key)
+        if arr.dtype == np.bool_:
+            return np.flatnonzero(arr)
+
+    return key
+
+
+_BUILTIN_SLICE_FUNCS: dict[str, SliceFunc] = {
+    "default": default_slice_func,
+    "native": native_slice_func,
+    "copy": copy_slice_func,
+}
+
+# Per-class slice plans, built lazily on the first __getitem__ call.
+# `get_type_hints` plus `Annotated` metadata unpacking is far too expensive to
+# repeat on every slice, and the result only depends on the class. A weak
+# mapping keeps dynamically created classes collectable.
+_SLICE_PLANS: "weakref.WeakKeyDictionary[type, tuple]" = weakref.WeakKeyDictionary()
+
+
+def _build_slice_plan(cls) -> tuple[tuple, tuple]:
+    """Resolve the attrs fields of `cls` into two per-class tuples.
+
+    Fields whose annotation is exactly one of `SCALAR_TYPES` and that carry
+    no explicit `SliceHint` land in the scalar group as `(name, alias)` —
+    scalars are immutable, so the sliced instance can reuse the value
+    directly without going through `default_slice_func` dispatch. Everything
+    else lands in the sliceable group as `(name, alias, slice_func, hint)`.
+    """
+    if "__attrs_attrs__" not in cls.__dict__:
+        # `attrs.has(cls)` passed only through inheritance: the class itself
+        # was never processed by `@attrs.define`, so fields declared on it are
+        # invisible to attrs and will be silently skipped when slicing. Warn
+        # once (the plan is cached per class) instead of degrading silently.
+        warnings.warn(
+            f"{cls!r} inherits from an attrs-based AutoSliceMixin class but is "
+            f"not itself decorated with @attrs.define; fields declared on "
+            f"{cls.__name__} will be skipped when slicing.",
+            UserWarning,
+        )
+
     cls_type_hints = get_type_hints(cls, include_extras=True)
-    fields = attrs.fields(cls)
 
-    new_values = {}
-    for field in fields:
-        value = getattr(self, field.name)
+    scalar_plan = []
+    sliceable_plan = []
+    for field in attrs.fields(cls):
+        annotation = cls_type_hints.get(field.name, None)
+        slice_hint = take_slice_hint(annotation)
+
+        if slice_hint is None and annotation in SCALAR_TYPES:
+            scalar_plan.append((field.name, field.alias))
+            continue
 
-        slice_hint = take_slice_hint(cls_type_hints.get(field.name, None))
         slice_hint = slice_hint or SliceHint()
 
         slice_func = slice_hint.func or default_slice_func
         if isinstance(slice_func, str):
-            if slice_func == "default":
-                slice_func = default_slice_func
-            elif slice_func == "native":
-                slice_func = native_slice_func
-            elif slice_func == "copy":
-                slice_func = copy_slice_func
-            else:
+            try:
+                slice_func = _BUILTIN_SLICE_FUNCS[slice_func]
+            except KeyError:
                 raise ValueError(f"Unknown built-in slice function: {slice_func!r}")
 
+        sliceable_plan.append((field.name, field.alias, slice_func, slice_hint))
+    return tuple(scalar_plan), tuple(sliceable_plan)
+
+
+def _getitem_impl_for_attrs(self, key: Any):
+    cls = type(self)
+    plan = _SLICE_PLANS.get(cls)
+    if plan is None:
+        plan = _SLICE_PLANS[cls] = _build_slice_plan(cls)
+
+    scalar_plan, sliceable_plan = plan
+
+    new_values = {}
+    for name, alias in scalar_plan:
+        # Immutable scalars: copy.copy would return the same object anyway
+        new_values[alias] = getattr(self, name)
+    for name, alias, slice_func, slice_hint in sliceable_plan:
+        value = getattr(self, name)
         try:
-            new_values[field.alias] = slice_func(value, key, hint=slice_hint)
+            new_values[alias] = slice_func(value, key, hint=slice_hint)
         except Exception as e:
             raise Exception(
-                f"Unable to slice {field.name!r} of type {type(value)!r} in {cls!r}"
+                f"Unable to slice {name!r} of type {type(value)!r} in {cls!r}"
             ) from e
     return cls(**new_values)
 
@@ -189,6 +322,8 @@ class AutoSliceMixin:
                 f"`AutoSliceMixin` only supports slicing semantics, but key type of {type(key)!r} implies indexing"
             )
 
+        key = _maybe_bool_mask_to_indices(key)
+
         cls = type(self)
         if attrs.has(cls):
             return _getitem_impl_for_attrs(self, key)
@@ -1,30 +1,65 @@
 from typing import Any, Callable
 from collections.abc import Mapping, Sequence
 from attrs import define, field
-from ._types import COMMON_ND_ARRAYS
+from ._types import COMMON_ND_ARRAYS, np
+import functools
 import inspect
+import weakref
 import wadler_lindig as wl
 
 
+# Interning cache for paths built via `/`. Tree walks rebuild the same paths
+# on every call; handing back the cached instance makes the identity check in
+# `in`-style membership tests succeed before the structural __eq__ runs. Weak
+# values keep abandoned paths collectable.
+_NODE_PATH_CACHE: "weakref.WeakValueDictionary[tuple, NodePath]" = (
+    weakref.WeakValueDictionary()
+)
+
+
 @define(frozen=True)
 class NodePath:
     # The first element is the name of the variable in the outermost scope
     parts: tuple[Any, ...] = field(factory=lambda: ("<root>", ))
 
+    # Lazily computed hash; see __hash__.
+    _hash: int | None = field(default=None, init=False, eq=False, repr=False)
+
     def __truediv__(self, next: Any) -> "NodePath":
-        return NodePath(self.parts + (next,))
+        parts = self.parts + (next,)
+        try:
+            path = _NODE_PATH_CACHE.get(parts)
+            if path is None:
+                path = NodePath(parts)
+                _NODE_PATH_CACHE[parts] = path
+            return path
+        except TypeError:
+            # Unhashable component; skip interning for this path
+            return NodePath(parts)
 
     def __str__(self) -> str:
         var_name = self.parts[0]
-        traversal = "".join(f"[{p:r}]" for p in self.parts[1:])
+        traversal = "".join(f"[{p!r}]" for p in self.parts[1:])
         return f"{var_name}{traversal}"
-    
+
     def __eq__(self, value: object) -> bool:
         """Two paths are equal if their parts, except the first one, are equal."""
         if not isinstance(value, NodePath):
             return False
         return self.parts[1:] == value.parts[1:]
 
+    def __hash__(self) -> int:
+        """Hash consistent with __eq__: the root part is excluded.
+
+        Cached on first use so that hash-based containers (sets, dict keys)
+        do not re-hash the parts tuple on every probe.
+        """
+        h = self._hash
+        if h is None:
+            h = hash(self.parts[1:])
+            object.__setattr__(self, "_hash", h)
+        return h
+
 
 @define
 class SlicingCtx:
@@ -33,6 +68,82 @@ class SlicingCtx:
     hint: int
     path: NodePath
 
+    # Number of True entries when `sl` is a boolean mask, None otherwise.
+    # Computed once at the top of `recursive_slice` so every leaf can
+    # short-circuit all-True / all-False masks without re-counting.
+    mask_ntrue: int | None = None
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_axis(shape: tuple, hint: int) -> int:
+    """Scan `shape` for the single dimension whose size equals `hint`.
+
+    Returns the dimension index, -1 if no dimension matches, or -2 if the
+    match is ambiguous. Error reporting is left to `_find_slice_dim`, which
+    knows the node path; keeping this function exception-free lets
+    `lru_cache` memoize the outcome per `(shape, hint)` pair — a call tree
+    typically holds many arrays of the same few shapes, and `arr.shape` is
+    already a hashable tuple.
+    """
+    count = 0
+    dim = -1
+    for i, sz in enumerate(shape):
+        if sz == hint:
+            dim = i
+            count += 1
+
+    if count == 0:
+        return -1
+    if count >= 2:
+        return -2
+    return dim
+
+
+def _find_slice_dim(shape: tuple, hint: int, _path: NodePath) -> int:
+    """Find the single dimension of `shape` whose size equals `hint`."""
+    dim = _find_axis(shape, hint)
+    if dim == -1:
+        raise ValueError(
+            f"Cannot find a proper dimension for {_path}, shape {shape}"
+        )
+    if dim == -2:
+        raise ValueError(
+            f"Multiple dimension candidates are found for {_path}, the shape {shape}"
+        )
+    return dim
+
+
+def _slice_nd_leaf(obj, sl, hint: int, _path: NodePath, _mask_ntrue: int | None):
+    """Slice a single ndarray-like leaf along the dimension matching `hint`."""
+    if obj.shape == (1,) or obj.shape == (0,):
+        return obj  # treat as scalar, do not slice
+
+    dim = _find_slice_dim(obj.shape, hint, _path)
+
+    # Short-circuit numpy leaves only: np.empty cannot build a torch/jax
+    # result, and those leaves must keep their own type. Also require the
+    # mask length to match the sliced dimension; a wrong-length mask must
+    # still reach numpy so it raises IndexError.
+    if (
+        _mask_ntrue is not None
+        and isinstance(obj, np.ndarray)
+        and sl.size == obj.shape[dim]
+    ):
+        if _mask_ntrue == sl.size:
+            # All-True mask: the selection is the whole array, skip the copy
+            return obj
+        if _mask_ntrue == 0:
+            # All-False mask: build the empty result without indexing
+            shape = obj.shape[:dim] + (0,) + obj.shape[dim + 1:]
+            return np.empty(shape, dtype=obj.dtype)
+
+    # Slicing. Numpy treats missing trailing indices as full slices, so only
+    # the leading `dim` axes need a placeholder; the hot dim == 0 case then
+    # indexes directly without building an index tuple at all.
+    if dim == 0:
+        return obj[sl]
+    return obj[(slice(None),) * dim + (sl,)]
+
 
 def recursive_slice(
     obj: Any,
@@ -41,13 +152,19 @@ def recursive_slice(
     _path: NodePath | None = None,
     custom_slicer_predicator: Callable[[SlicingCtx], bool] | None = None,
     custom_slicer: Callable[[SlicingCtx], Any] | None = None,
+    bulk: bool = False,
+    _mask_ntrue: int | None = None,
 ) -> Any:
     """Recursive slice a dict of ndarrays or nested dicts.
 
     The following rules are applied sequentially:
 
     - If a custom slicer is provided and the predicator returns True,
-        the custom slicer is used to process the object.
+        the custom slicer is used to process the object. Predicators that
+        match against a fixed set of paths should keep them in a
+        `frozenset` of `NodePath`s: `NodePath` is hashable with a cached
+        hash, so membership is a single O(1) lookup instead of one
+        structural comparison per candidate.
 
     - If the object is dict-like (Mapping), each value is sliced recursively.
 
@@ -68,6 +185,11 @@ def recursive_slice(
         sl (slice): slice object.
         hint (int): dimension hint.
         _path (NodePath, optional): internal use only.
+        bulk (bool): gather all numpy leaves in one indexing operation
+            instead of slicing them one by one. Structurally equivalent
+            results, but the per-leaf indexing setup cost is paid once per
+            dtype rather than once per array. Not compatible with custom
+            slicers; non-numpy leaves still go through the per-leaf path.
 
     Returns:
         Any: sliced structure.
@@ -78,6 +200,17 @@ def recursive_slice(
             "Both custom_slicer and custom_slicer_predicator should be provided or neither."
         )
 
+    if (
+        _mask_ntrue is None
+        and np is not None
+        and isinstance(sl, np.ndarray)
+        and sl.dtype == np.bool_
+    ):
+        # Count the boolean mask once up front; the count is threaded through
+        # the recursion so that every array leaf can short-circuit all-True
+        # and all-False masks without paying for the indexed copy.
+        _mask_ntrue = int(np.count_nonzero(sl))
+
     if _path is None:
         # Do some magic to get the variable name of `obj` in the
         # caller's frame. This is best-effort and may not always work.
@@ -100,7 +233,14 @@ def recursive_slice(
             var_name = "<obj_to_be_sliced>"
         _path = NodePath(parts=(var_name,))
 
-    ctx = SlicingCtx(item=obj, sl=sl, hint=hint, path=_path)
+    if bulk:
+        if custom_slicer is not None:
+            raise ValueError("bulk mode does not support custom slicers.")
+        if np is not None:
+            return _bulk_recursive_slice(obj, sl, hint, _path, _mask_ntrue)
+        # numpy unavailable: degrade to the normal per-leaf walk
+
+    ctx = SlicingCtx(item=obj, sl=sl, hint=hint, path=_path, mask_ntrue=_mask_ntrue)
     if (custom_slicer_predicator is not None) and custom_slicer_predicator(ctx):
         assert custom_slicer is not None
         return custom_slicer(ctx)
@@ -112,36 +252,12 @@ def recursive_slice(
                 obj[k], sl, hint=hint, _path=_path / k,
                 custom_slicer_predicator=custom_slicer_predicator,
                 custom_slicer=custom_slicer,
+                _mask_ntrue=_mask_ntrue,
             )
         return sliced_obj
 
     elif isinstance(obj, COMMON_ND_ARRAYS):
-        if obj.shape == (1,) or obj.shape == (0,):
-            return obj  # treat as scalar, do not slice
-
-        # Find the dimension that has the size `hint`
-        count = 0
-        dim = -1
-        for i, sz in enumerate(obj.shape):
-            if sz == hint:
-                dim = i
-                count += 1
-
-        if count == 0:
-            raise ValueError(
-                f"Cannot find a proper dimension for {_path}, shape {obj.shape}"
-            )
-        if count >= 2:
-            raise ValueError(
-                f"Multiple dimension candidates are found for {_path}, the shape {obj.shape}"
-            )
-
-        # Slicing
-        slc = [slice(None)] * len(obj.shape)
-        slc[dim] = sl
-
-        sliced_obj = obj[tuple(slc)]
-        return sliced_obj
+        return _slice_nd_leaf(obj, sl, hint, _path, _mask_ntrue)
 
     elif isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
         sliced_obj = []
@@ -150,6 +266,7 @@ def recursive_slice(
                 item, sl, hint=hint, _path=_path / i,
                 custom_slicer_predicator=custom_slicer_predicator,
                 custom_slicer=custom_slicer,
+                _mask_ntrue=_mask_ntrue,
             )
             sliced_obj.append(sliced_item)
         if isinstance(obj, tuple):
@@ -158,3 +275,83 @@ def recursive_slice(
 
     else:
         return obj
+
+
+def _bulk_recursive_slice(
+    obj: Any,
+    sl: slice,
+    hint: int,
+    _path: NodePath,
+    _mask_ntrue: int | None,
+) -> Any:
+    """Slice all numpy leaves of `obj` with a single gather per dtype.
+
+    Numpy pays a fixed setup cost (key normalization, bounds checking) per
+    indexing call. When a tree holds many arrays sliced by the same key, it
+    is cheaper to flatten each leaf to `(hint, width)`, concatenate the
+    leaves of one dtype side by side, index the combined buffer once, and
+    split the result back. Non-numpy leaves (torch, jax, scalars, ...) are
+    handled exactly as in the per-leaf walk.
+    """
+
+    # Pass 1: collect the numpy leaves (and their slicing dimension)
+    leaves: list[tuple[Any, int]] = []
+
+    def collect(o: Any, p: NodePath) -> None:
+        if isinstance(o, Mapping):
+            for k in o:
+                collect(o[k], p / k)
+        elif isinstance(o, np.ndarray):
+            if o.shape == (1,) or o.shape == (0,):
+                return
+            leaves.append((o, _find_slice_dim(o.shape, hint, p)))
+        elif isinstance(o, Sequence) and not isinstance(o, (str, bytes)):
+            for i, item in enumerate(o):
+                collect(item, p / i)
+
+    collect(obj, _path)
+
+    # Pass 2: one gather per dtype
+    sliced: dict[int, Any] = {}  # id(leaf array) -> sliced array
+
+    by_dtype: dict[Any, list[tuple[Any, int]]] = {}
+    for arr, dim in leaves:
+        by_dtype.setdefault(arr.dtype, []).append((arr, dim))
+
+    for group in by_dtype.values():
+        # Bring the sliced dimension to the front and flatten the rest, so
+        # the group concatenates into a single (hint, total_width) buffer.
+        prepared = [np.moveaxis(arr, dim, 0).reshape(hint, -1) for arr, dim in group]
+        widths = [part.shape[1] for part in prepared]
+
+        stacked = np.concatenate(prepared, axis=1)
+        gathered = stacked[sl]
+        n_kept = gathered.shape[0]
+
+        offset = 0
+        for (arr, dim), width in zip(group, widths):
+            part = gathered[:, offset:offset + width]
+            offset += width
+
+            # Shape of the moved-axis result, computed arithmetically instead
+            # of materializing another moveaxis view just to read its shape
+            moved_shape = (n_kept,) + arr.shape[:dim] + arr.shape[dim + 1:]
+            sliced[id(arr)] = np.moveaxis(part.reshape(moved_shape), 0, dim)
+
+    # Pass 3: rebuild the tree, substituting the gathered results
+    def rebuild(o: Any, p: NodePath) -> Any:
+        if isinstance(o, Mapping):
+            return {k: rebuild(o[k], p / k) for k in o}
+        elif isinstance(o, np.ndarray):
+            if id(o) in sliced:
+                return sliced[id(o)]
+            return o  # scalar-shaped arrays stay untouched
+        elif isinstance(o, COMMON_ND_ARRAYS):
+            return _slice_nd_leaf(o, sl, hint, p, _mask_ntrue)
+        elif isinstance(o, Sequence) and not isinstance(o, (str, bytes)):
+            rebuilt = [rebuild(item, p / i) for i, item in enumerate(o)]
+            return tuple(rebuilt) if isinstance(o, tuple) else rebuilt
+        else:
+            return o
+
+    return rebuild(obj, _path)
@@ -109,6 +109,34 @@ class LoguruInitalizer:
         return self
     
     
+    @validate_call
+    def set_level_live(self, level: LogLevel | int):
+        """Change the level of the already-installed sinks in place.
+
+        Re-running `initialize` tears down and re-adds every sink, which
+        re-opens files and rebuilds formatters. When only the verbosity
+        changes, rewriting the level threshold of the existing handlers is
+        enough. Re-initialize only when the preset itself changes.
+
+        This reaches into loguru internals (`logger._core.handlers`), as
+        loguru exposes no public way to retune a sink's level without
+        removing it.
+        """
+        levelno = logger.level(level).no if isinstance(level, str) else level
+
+        core = logger._core
+        with core.lock:
+            for handler in core.handlers.values():
+                handler._levelno = levelno
+            core.min_level = min(
+                (h._levelno for h in core.handlers.values()),
+                default=levelno,
+            )
+
+        self._level = level
+        return self
+
+
     @validate_call
     def set_enqueue(self, enqueue: bool = True):
         self._enqueue = enqueue
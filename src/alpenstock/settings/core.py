@@ -9,6 +9,87 @@ import textwrap
 from . import utils
 
 
+# Below this size, the setup cost of the C parser outweighs its throughput
+# advantage and the pure-Python safe backend is the faster choice.
+_SAFE_PURE_SIZE_THRESHOLD = 64 * 1024
+
+
+def _make_rt_yaml() -> YAML:
+    """Round-trip YAML instance, required whenever comments matter."""
+    yaml = YAML(typ="rt")
+    yaml.preserve_quotes = True
+    return yaml
+
+
+def _make_safe_yaml(size_hint: int | None = None) -> YAML:
+    """Comment-free YAML instance.
+
+    `typ="safe"` runs on the C parser/emitter from `ruamel.yaml.clib` when it
+    is installed (falling back to pure Python automatically), which is several
+    times faster than the round-trip machinery. Only usable where comment
+    preservation is not needed.
+
+    For documents known to be small (`size_hint` below
+    `_SAFE_PURE_SIZE_THRESHOLD`), the pure-Python backend is picked instead:
+    crossing into the C extension costs more than parsing a few lines.
+    """
+    if size_hint is not None and size_hint < _SAFE_PURE_SIZE_THRESHOLD:
+        yaml = YAML(typ="safe", pure=True)
+    else:
+        yaml = YAML(typ="safe")
+    yaml.default_flow_style = False
+    # Keep the model's field order instead of sorting keys alphabetically
+    yaml.representer.sort_base_mapping_type_on_output = False
+    return yaml
+
+
+def _ensure_commented(obj):
+    """Recursively wrap plain containers into `Commented*` equivalents.
+
+    The safe loader yields plain dicts/lists; the rest of the Settings
+    machinery (`_link_children`, `_update_yaml`) expects the ruamel
+    round-trip containers, which also keep the document's key order.
+    """
+    if isinstance(obj, dict) and not isinstance(obj, CommentedMap):
+        return CommentedMap((k, _ensure_commented(v)) for k, v in obj.items())
+    if isinstance(obj, list) and not isinstance(obj, CommentedSeq):
+        return CommentedSeq(_ensure_commented(v) for v in obj)
+    return obj
+
+
+def _strip_commented(obj):
+    """Plain-container view of a `Commented*` tree for the safe representer.
+
+    The safe representer dispatches on exact types, so round-trip containers
+    and scalar subclasses (e.g. `SingleQuotedScalarString`) must be folded
+    back into their builtin bases.
+    """
+    if isinstance(obj, dict):
+        return {k: _strip_commented(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_strip_commented(v) for v in obj]
+    t = type(obj)
+    if t is not str and isinstance(obj, str):
+        return str(obj)
+    if t is not bool and t is not int and isinstance(obj, int):
+        return int(obj)
+    if t is not float and isinstance(obj, float):
+        return float(obj)
+    return obj
+
+
+def _has_comments(obj) -> bool:
+    """Whether any node of a `Commented*` tree carries comment tokens."""
+    ca = getattr(obj, "ca", None)
+    if ca is not None and (ca.comment or ca.items or ca.end or ca.pre):
+        return True
+    if isinstance(obj, dict):
+        return any(_has_comments(v) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_has_comments(v) for v in obj)
+    return False
+
+
 class Settings(BaseModel):
     """
     Base class for configuration settings with YAML serialization/deserialization
@@ -38,20 +119,29 @@ class Settings(BaseModel):
         If the environment variable is not set, it will be replaced with an
         empty string.
         """
-        yaml = YAML(typ="rt")
-        yaml.preserve_quotes = True
-        
-        # Load the YAML file
+        # Read the whole document first so the loader can be picked from its
+        # content: the round-trip machinery is only needed when there is a
+        # comment to preserve.
         if isinstance(src, (str, os.PathLike)):
-            src = Path(src)
-            with open(src, 'r', encoding='utf-8') as f:
-                raw_yaml = yaml.load(f)
-        
-        elif isinstance(src, (bytes, bytearray)) or hasattr(src, 'read'):
-            raw_yaml = yaml.load(src)
-        
+            data = Path(src).read_bytes()
+        elif isinstance(src, (bytes, bytearray)):
+            data = bytes(src)
+        elif hasattr(src, 'read'):
+            data = src.read()
         else:
             raise TypeError(f"Unsupported type for 'src': {type(src)}")
+
+        marker = "#" if isinstance(data, str) else b"#"
+        if marker in data:
+            # May contain comments (a '#' inside a quoted scalar also lands
+            # here, which only costs the slower loader, never correctness)
+            yaml = _make_rt_yaml()
+            raw_yaml = yaml.load(data)
+        else:
+            # Comment-free: the safe loader is several times faster. Note
+            # that scalar quoting style is not preserved on this path.
+            yaml = _make_safe_yaml(size_hint=len(data))
+            raw_yaml = _ensure_commented(yaml.load(data))
         
         # Optionally replace environment variables
         if replace_env_vars:
@@ -96,22 +186,29 @@ class Settings(BaseModel):
         
         # Now dst must be a file-like object
         if not enable_comments:
-            # Simple dump without comments
-            yaml = YAML()
+            # Simple dump without comments; the safe dumper is C-backed
+            yaml = _make_safe_yaml()
             yaml.dump(self.model_dump(), dst)
             return
-        
-        # Dump with comment preservation
-        yaml = YAML(typ="rt")
-        yaml.indent(mapping=2, sequence=4, offset=2)
-        yaml.preserve_quotes = True
-        
+
         ## Update the original YAML structure with current values
         self._update_yaml(
             cur_indent=0,
             fill_default_comments=fill_default_comments,
             comment_width=comment_width
         )
+
+        if not fill_default_comments and not _has_comments(self._yaml):
+            # Nothing round-trip-specific survives into the output, so the
+            # faster safe emitter produces the same document
+            yaml = _make_safe_yaml()
+            yaml.indent(mapping=2, sequence=4, offset=2)
+            yaml.dump(_strip_commented(self._yaml), dst)
+            return
+
+        # Dump with comment preservation
+        yaml = _make_rt_yaml()
+        yaml.indent(mapping=2, sequence=4, offset=2)
         yaml.dump(self._yaml, dst)
         
     def _update_yaml(
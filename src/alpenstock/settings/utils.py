@@ -4,73 +4,92 @@ from typing import Any
 import re as regex
 
 
+# Compiled once at import time; `replace_env_vars` calls the matcher for
+# every string value in a config tree, so per-call compilation (or even the
+# `re` compile-cache probe) adds up. Two patterns are kept so that group 1
+# always holds the variable name, whichever form matched. Whitespace is
+# stripped before matching, so the patterns stay fully anchored.
+_ENV_BRACED_RE = regex.compile(r'^\$\{(\w+)\}$')
+_ENV_BARE_RE = regex.compile(r'^\$(\w+)$')
+
+
 def match_env_var_placeholder(value: str) -> regex.Match | None:
     """match if the given string is an environment variable placeholder.
-    
+
     The following formats are supported:
     - ${ENV_VAR}
     - $ENV_VAR
-    
+
     The matching is designed to be strict, the entire string should
-    contain only exactly one placeholder, with leading and trailing 
+    contain only exactly one placeholder, with leading and trailing
     whitespace allowed.
 
+    On a match, group 1 holds the variable name.
+
     Args:
         value (str): _description_
 
     Returns:
         regex.Match | None: _description_
     """
-    
-    patterns = [
-        regex.compile(r'^\$\{(\w+)\}$'),
-        regex.compile(r'^\$(\w+)$')
-    ]
-    
     value = value.strip()
-    
-    for pat in patterns:
-        match = pat.match(value)
-        if match:
-            return match
-    
-    return None
 
+    # Most config strings are not placeholders at all; a C-level startswith
+    # rejects them without entering the regex engine.
+    if not value.startswith("$"):
+        return None
 
-def replace_env_vars(obj: Any, *, _path=None) -> Any:
+    return _ENV_BRACED_RE.match(value) or _ENV_BARE_RE.match(value)
+
+
+def replace_env_vars(obj: Any) -> Any:
     """
-    Recursively replace environment variable placeholders in the given object.
-    
-    If a string holds exactly one environment variable placeholder, such as 
+    Replace environment variable placeholders in the given object, walking
+    nested mappings and sequences.
+
+    If a string holds exactly one environment variable placeholder, such as
     `${ENV_VAR}` or `$ENV_VAR`, it will be replaced with the value of the
     corresponding environment variable. If the environment variable is not set,
     it will be replaced with an empty string.
+
+    The traversal is iterative (an explicit work stack) rather than recursive:
+    deep config trees would otherwise pay one Python call frame per node,
+    which dominates the actual substitution work.
     """
-    
-    if _path is None:
-        _path = "#"
-    
-    if isinstance(obj, MutableMapping):
-        for key, value in obj.items():
-            obj[key] = replace_env_vars(value, _path=f"{_path}.{key}")
-        return obj
-    
-    elif isinstance(obj, MutableSequence) and not isinstance(obj, str):
-        for idx in range(len(obj)):
-            obj[idx] = replace_env_vars(obj[idx], _path=f"{_path}[{idx}]")
-        return obj
-    
-    elif isinstance(obj, str):
+
+    # The root is handled directly; containers are mutated in place via the
+    # stack below.
+    if isinstance(obj, str):
         m = match_env_var_placeholder(obj)
         if m:
-            env_var_name = m.group(1)
-            return os.getenv(env_var_name, "")
-        else:
-            return obj
-        
-    elif isinstance(obj, Collection):
-        raise TypeError(f"Unsupported collection type at {_path}: {type(obj)}")
-    
-    else:
+            return os.getenv(m.group(1), "")
+        return obj
+
+    if not isinstance(obj, (MutableMapping, MutableSequence)):
+        if isinstance(obj, Collection):
+            raise TypeError(f"Unsupported collection type at #: {type(obj)}")
         return obj
 
+    stack: list[tuple[Any, str]] = [(obj, "#")]
+    while stack:
+        cur, path = stack.pop()
+
+        if isinstance(cur, MutableMapping):
+            entries = [(k, v, f"{path}.{k}") for k, v in cur.items()]
+        else:  # MutableSequence
+            entries = [(i, v, f"{path}[{i}]") for i, v in enumerate(cur)]
+
+        for key, value, child_path in entries:
+            if isinstance(value, str):
+                m = match_env_var_placeholder(value)
+                if m:
+                    cur[key] = os.getenv(m.group(1), "")
+            elif isinstance(value, (MutableMapping, MutableSequence)):
+                stack.append((value, child_path))
+            elif isinstance(value, Collection):
+                raise TypeError(
+                    f"Unsupported collection type at {child_path}: {type(value)}"
+                )
+
+    return obj
+
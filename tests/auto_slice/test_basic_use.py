@@ -46,56 +46,56 @@ def test_python_slice(default_weather):
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [1, 4, 5]
-    assert np.allclose(subset.humidities, np.array([10, 40, 50]))
-    assert np.allclose(subset.sitewise_temperatures, np.array([[1, 4, 1], [7, 1, 8]]))
+    assert np.array_equal(subset.humidities, np.array([10, 40, 50]))
+    assert np.array_equal(subset.sitewise_temperatures, np.array([[1, 4, 1], [7, 1, 8]]))
 
     # stop only
     subset = data[:2]
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [1, 1]
-    assert np.allclose(subset.humidities, np.array([10, 10]))
-    assert np.allclose(subset.sitewise_temperatures, np.array([[3, 1], [2, 7]]))
+    assert np.array_equal(subset.humidities, np.array([10, 10]))
+    assert np.array_equal(subset.sitewise_temperatures, np.array([[3, 1], [2, 7]]))
 
     # start only
     subset = data[3:]
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [5, 1, 4]
-    assert np.allclose(subset.humidities, np.array([50, 10, 40]))
-    assert np.allclose(subset.sitewise_temperatures, np.array([[1, 5, 9], [8, 2, 8]]))
+    assert np.array_equal(subset.humidities, np.array([50, 10, 40]))
+    assert np.array_equal(subset.sitewise_temperatures, np.array([[1, 5, 9], [8, 2, 8]]))
 
     # negative start only
     subset = data[-1:]
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [4]
-    assert np.allclose(subset.humidities, np.array([40]))
-    assert np.allclose(subset.sitewise_temperatures, np.array([[9], [8]]))
+    assert np.array_equal(subset.humidities, np.array([40]))
+    assert np.array_equal(subset.sitewise_temperatures, np.array([[9], [8]]))
 
     # negative end only
     subset = data[:-3]
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [1, 1, 4]
-    assert np.allclose(subset.humidities, np.array([10, 10, 40]))
-    assert np.allclose(subset.sitewise_temperatures, np.array([[3, 1, 4], [2, 7, 1]]))
+    assert np.array_equal(subset.humidities, np.array([10, 10, 40]))
+    assert np.array_equal(subset.sitewise_temperatures, np.array([[3, 1, 4], [2, 7, 1]]))
 
     # steps
     subset = data[::2]
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [1, 4, 1]
-    assert np.allclose(subset.humidities, np.array([10, 40, 10]))
-    assert np.allclose(subset.sitewise_temperatures, np.array([[3, 4, 5], [2, 1, 2]]))
+    assert np.array_equal(subset.humidities, np.array([10, 40, 10]))
+    assert np.array_equal(subset.sitewise_temperatures, np.array([[3, 4, 5], [2, 1, 2]]))
 
     # reverse
     subset = data[::-1]
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [4, 1, 5, 4, 1, 1]
-    assert np.allclose(subset.humidities, np.array([40, 10, 50, 40, 10, 10]))
-    assert np.allclose(
+    assert np.array_equal(subset.humidities, np.array([40, 10, 50, 40, 10, 10]))
+    assert np.array_equal(
         subset.sitewise_temperatures, np.array([[9, 5, 1, 4, 1, 3], [8, 2, 8, 1, 7, 2]])
     )
 
@@ -104,8 +104,8 @@ def test_python_slice(default_weather):
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [1, 1]
-    assert np.allclose(subset.humidities, np.array([10, 10]))
-    assert np.allclose(subset.sitewise_temperatures, np.array([[3, 1], [2, 7]]))
+    assert np.array_equal(subset.humidities, np.array([10, 10]))
+    assert np.array_equal(subset.sitewise_temperatures, np.array([[3, 1], [2, 7]]))
 
 
 def test_fancy_slice(default_weather):
@@ -116,8 +116,8 @@ def test_fancy_slice(default_weather):
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [1, 5, 4, 4]
-    assert np.allclose(subset.humidities, np.array([10, 50, 40, 40]))
-    assert np.allclose(
+    assert np.array_equal(subset.humidities, np.array([10, 50, 40, 40]))
+    assert np.array_equal(
         subset.sitewise_temperatures, np.array([[3, 1, 4, 9], [2, 8, 1, 8]])
     )
 
@@ -126,8 +126,8 @@ def test_fancy_slice(default_weather):
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [1, 5, 4, 4]
-    assert np.allclose(subset.humidities, np.array([10, 50, 40, 40]))
-    assert np.allclose(
+    assert np.array_equal(subset.humidities, np.array([10, 50, 40, 40]))
+    assert np.array_equal(
         subset.sitewise_temperatures, np.array([[3, 1, 4, 9], [2, 8, 1, 8]])
     )
 
@@ -136,8 +136,8 @@ def test_fancy_slice(default_weather):
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [1, 4, 4]
-    assert np.allclose(subset.humidities, np.array([10, 40, 40]))
-    assert np.allclose(subset.sitewise_temperatures, np.array([[3, 4, 9], [2, 1, 8]]))
+    assert np.array_equal(subset.humidities, np.array([10, 40, 40]))
+    assert np.array_equal(subset.sitewise_temperatures, np.array([[3, 4, 9], [2, 1, 8]]))
 
     # key type: boolean mask (numpy array)
     mask = np.array([True, False, True, False, False, True])
@@ -145,8 +145,8 @@ def test_fancy_slice(default_weather):
     assert subset.city == "Gotham"
     assert subset.postcode == 12345
     assert subset.temperatures == [1, 4, 4]
-    assert np.allclose(subset.humidities, np.array([10, 40, 40]))
-    assert np.allclose(subset.sitewise_temperatures, np.array([[3, 4, 9], [2, 1, 8]]))
+    assert np.array_equal(subset.humidities, np.array([10, 40, 40]))
+    assert np.array_equal(subset.sitewise_temperatures, np.array([[3, 4, 9], [2, 1, 8]]))
 
 
 def test_prohibit_indexing(default_weather):
@@ -172,8 +172,8 @@ def test_nested_structure(default_nested_data):
     assert subset.weather.city == "Gotham"
     assert subset.weather.postcode == 12345
     assert subset.weather.temperatures == [1, 4, 5]
-    assert np.allclose(subset.weather.humidities, np.array([10, 40, 50]))
-    assert np.allclose(
+    assert np.array_equal(subset.weather.humidities, np.array([10, 40, 50]))
+    assert np.array_equal(
         subset.weather.sitewise_temperatures, np.array([[1, 4, 1], [7, 1, 8]])
     )
 
@@ -1,19 +1,10 @@
-from alpenstock.auto_slice import AutoSliceMixin, SliceHint
+from alpenstock.auto_slice import AutoSliceMixin, SliceHint, fancy_slice_for_str
 import attrs
-from typing import Annotated, Any
+from typing import Annotated
 import numpy as np
 import pytest
 
 
-def fancy_slice_for_str(value: str, key: Any, hint: SliceHint = None):
-    if isinstance(key, slice):
-        return value[key]
-    
-    value = np.asarray(list(value))
-    rst = "".join(value[key])
-    return rst
-
-
 @attrs.define
 class Weather(AutoSliceMixin):
     # treated as a scalar
@@ -49,18 +40,18 @@ def test_customization(default_weather):
     assert subset.city == "ga kuen to shi"
     assert subset.temperatures == [20, 57]
     assert subset.raining == "SW"
-    assert np.allclose(subset.site_image, site_image)
+    assert np.array_equal(subset.site_image, site_image)
 
     # Fancy slicing (list of indices)
     subset = data[[1, -2]]
     assert subset.city == "ga kuen to shi"
     assert subset.temperatures == [20, 57]
     assert subset.raining == "SW"
-    assert np.allclose(subset.site_image, site_image)
+    assert np.array_equal(subset.site_image, site_image)
     
     # Fancy slicing (mask)
     subset = data[[False, True, True, False]]
     assert subset.city == "ga kuen to shi"
     assert subset.temperatures == [20, 57]
     assert subset.raining == "SW"
-    assert np.allclose(subset.site_image, site_image)
\ No newline at end of file
+    assert np.array_equal(subset.site_image, site_image)
\ No newline at end of file
@@ -21,14 +21,48 @@ def test_recursive_slice_basic(sample_data):
 
     sliced = recursive_slice(data, slice(1, 4), hint=5)
 
-    assert np.allclose(sliced["a"], np.array([2, 3, 4]))
-    assert np.allclose(sliced["b"], np.array([[30, 40], [50, 60], [70, 80]]))
-    assert np.allclose(sliced["nested"]["x"], np.array([[2, 3, 4]]))
+    assert np.array_equal(sliced["a"], np.array([2, 3, 4]))
+    assert np.array_equal(sliced["b"], np.array([[30, 40], [50, 60], [70, 80]]))
+    assert np.array_equal(sliced["nested"]["x"], np.array([[2, 3, 4]]))
     assert sliced["scalar"] == 42
-    assert np.allclose(sliced["treat_as_scalar"], np.array([1]))
-    assert np.allclose(sliced["treat_as_scalar_empty"], np.array([]))
-    assert np.allclose(sliced["array"][0], np.array([200, 300, 400]))
-    assert np.allclose(sliced["array"][1], np.array([[[2, 3, 4]]]))
+    assert np.array_equal(sliced["treat_as_scalar"], np.array([1]))
+    assert np.array_equal(sliced["treat_as_scalar_empty"], np.array([]))
+    assert np.array_equal(sliced["array"][0], np.array([200, 300, 400]))
+    assert np.array_equal(sliced["array"][1], np.array([[[2, 3, 4]]]))
+
+
+def test_bulk_slice_matches_per_leaf(sample_data):
+    data = sample_data
+
+    keys = [
+        slice(1, 4),
+        np.array([0, 2, 4]),
+        np.array([True, False, True, False, True]),
+    ]
+    for key in keys:
+        per_leaf = recursive_slice(data, key, hint=5)
+        bulk = recursive_slice(data, key, hint=5, bulk=True)
+
+        assert np.array_equal(bulk["a"], per_leaf["a"])
+        assert np.array_equal(bulk["b"], per_leaf["b"])
+        assert np.array_equal(bulk["nested"]["x"], per_leaf["nested"]["x"])
+        assert bulk["scalar"] == 42
+        assert np.array_equal(bulk["treat_as_scalar"], np.array([1]))
+        assert np.array_equal(bulk["treat_as_scalar_empty"], np.array([]))
+        assert np.array_equal(bulk["array"][0], per_leaf["array"][0])
+        assert np.array_equal(bulk["array"][1], per_leaf["array"][1])
+
+
+def test_bulk_slice_rejects_custom_slicer(sample_data):
+    with pytest.raises(ValueError, match=r".*bulk mode.*"):
+        recursive_slice(
+            sample_data,
+            slice(1, 4),
+            hint=5,
+            bulk=True,
+            custom_slicer_predicator=lambda ctx: False,
+            custom_slicer=lambda ctx: None,
+        )
 
 
 def test_custom_slicer(sample_data):
@@ -41,10 +75,13 @@ def test_custom_slicer(sample_data):
     # while the rest are sliced normally
     p2 = NodePath() / "array"
 
+    # NodePath is hashable (with a cached hash), so prefer a frozenset over a
+    # tuple for membership tests: lookup is O(1) instead of one structural
+    # __eq__ per candidate path.
+    custom_paths = frozenset({p1, p2})
+
     def custom_slicer_predicator(ctx):
-        if ctx.path in (p1, p2):
-            return True
-        return False
+        return ctx.path in custom_paths
 
     def custom_slicer(ctx):
         if ctx.path == p1:
@@ -78,14 +115,14 @@ def test_custom_slicer(sample_data):
 
     # The custom slicer should drop the first element in this array
     assert len(sliced["array"]) == 1
-    assert np.allclose(sliced["array"][0], np.array([[[2, 3, 4]]]))
+    assert np.array_equal(sliced["array"][0], np.array([[[2, 3, 4]]]))
 
     # All other parts should be sliced normally
-    assert np.allclose(sliced["a"], np.array([2, 3, 4]))
-    assert np.allclose(sliced["b"], np.array([[30, 40], [50, 60], [70, 80]]))
-    assert np.allclose(sliced["nested"]["x"], np.array([[2, 3, 4]]))
+    assert np.array_equal(sliced["a"], np.array([2, 3, 4]))
+    assert np.array_equal(sliced["b"], np.array([[30, 40], [50, 60], [70, 80]]))
+    assert np.array_equal(sliced["nested"]["x"], np.array([[2, 3, 4]]))
     assert sliced["scalar"] == 42
-    assert np.allclose(sliced["treat_as_scalar_empty"], np.array([]))
+    assert np.array_equal(sliced["treat_as_scalar_empty"], np.array([]))
 
 
 def test_recursive_slice_errors():
@@ -1,5 +1,6 @@
 from alpenstock.auto_slice import AutoSliceMixin
 import attrs
+import pytest
 
 @attrs.define
 class BaseDataclass(AutoSliceMixin):
@@ -27,8 +28,10 @@ def test_forget_attrs_define():
     assert subset.b == [1, 2]
     assert subset.c == [10, 20]
     
-    # wierd behavior of we forget `@attrs.define`
-    subset = wrong[:2]
+    # wierd behavior of we forget `@attrs.define`; the first slice warns
+    # because the class itself was never processed by `@attrs.define`
+    with pytest.warns(UserWarning, match=r".*@attrs\.define.*"):
+        subset = wrong[:2]
     assert isinstance(subset, ForgetAttrsDefine)
     
     # The expected value should be [-10, -20], but the slicing just skips the